@@ -1,5 +1,5 @@
 """Open Peer Power Supervisor setup."""
-from setuptools import setup
+from setuptools import find_packages, setup
 
 from supervisor.const import SUPERVISOR_VERSION
 
@@ -30,25 +30,6 @@ setup(
     keywords=["docker", "openpeerpower", "api"],
     zip_safe=False,
     platforms="any",
-    packages=[
-        "supervisor",
-        "supervisor.docker",
-        "supervisor.addons",
-        "supervisor.api",
-        "supervisor.dbus",
-        "supervisor.dbus.payloads",
-        "supervisor.dbus.network",
-        "supervisor.discovery",
-        "supervisor.discovery.services",
-        "supervisor.services",
-        "supervisor.services.modules",
-        "supervisor.openpeerpower",
-        "supervisor.host",
-        "supervisor.misc",
-        "supervisor.utils",
-        "supervisor.plugins",
-        "supervisor.snapshots",
-        "supervisor.store",
-    ],
+    packages=find_packages(include=["supervisor", "supervisor.*"]),
     include_package_data=True,
 )
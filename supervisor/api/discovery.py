@@ -1,4 +1,6 @@
 """Init file for Supervisor network RESTful API."""
+from collections import defaultdict
+
 import voluptuous as vol
 
 from ..const import (
@@ -28,7 +30,7 @@ class APIDiscovery(CoreSysAttributes):
 
     def _extract_message(self, request):
         """Extract discovery message from URL."""
-        message = self.sys_discovery.get(request.match_info.get("uuid"))
+        message = self.sys_discovery.get(request.match_info["uuid"])
         if not message:
             raise APIError("Discovery message not found")
         return message
@@ -44,24 +46,23 @@ class APIDiscovery(CoreSysAttributes):
         self._check_permission_ha(request)
 
         # Get available discovery
-        discovery = []
-        for message in self.sys_discovery.list_messages:
-            discovery.append(
-                {
-                    ATTR_ADDON: message.addon,
-                    ATTR_SERVICE: message.service,
-                    ATTR_UUID: message.uuid,
-                    ATTR_CONFIG: message.config,
-                }
-            )
+        discovery = [
+            {
+                ATTR_ADDON: message.addon,
+                ATTR_SERVICE: message.service,
+                ATTR_UUID: message.uuid,
+                ATTR_CONFIG: message.config,
+            }
+            for message in self.sys_discovery.list_messages
+        ]
 
         # Get available services/add-ons
-        services = {}
+        services = defaultdict(list)
         for addon in self.sys_addons.all:
             for name in addon.discovery:
-                services.setdefault(name, []).append(addon.slug)
+                services[name].append(addon.slug)
 
-        return {ATTR_DISCOVERY: discovery, ATTR_SERVICES: services}
+        return {ATTR_DISCOVERY: discovery, ATTR_SERVICES: dict(services)}
 
     @api_process
     async def set_discovery(self, request):
@@ -28,7 +28,7 @@ from ..const import (
     REQUEST_FROM,
 )
 from ..coresys import CoreSysAttributes
-from .utils import api_process, api_validate
+from .utils import api_process, api_validate, websocket_forward
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -157,8 +157,8 @@ class APIIngress(CoreSysAttributes):
             # Proxy requests
             await asyncio.wait(
                 [
-                    _websocket_forward(ws_server, ws_client),
-                    _websocket_forward(ws_client, ws_server),
+                    websocket_forward(ws_server, ws_client),
+                    websocket_forward(ws_client, ws_server),
                 ],
                 return_when=asyncio.FIRST_COMPLETED,
             )
@@ -272,21 +272,3 @@ def _is_websocket(request: web.Request) -> bool:
     ):
         return True
     return False
-
-
-async def _websocket_forward(ws_from, ws_to):
-    """Handle websocket message directly."""
-    try:
-        async for msg in ws_from:
-            if msg.type == aiohttp.WSMsgType.TEXT:
-                await ws_to.send_str(msg.data)
-            elif msg.type == aiohttp.WSMsgType.BINARY:
-                await ws_to.send_bytes(msg.data)
-            elif msg.type == aiohttp.WSMsgType.PING:
-                await ws_to.ping()
-            elif msg.type == aiohttp.WSMsgType.PONG:
-                await ws_to.pong()
-            elif ws_to.closed:
-                await ws_to.close(code=ws_to.close_code, message=msg.extra)
-    except RuntimeError:
-        _LOGGER.warning("Ingress Websocket runtime error")
@@ -63,23 +63,24 @@ class APIOpenPeerPower(CoreSysAttributes):
     @api_process
     async def info(self, request: web.Request) -> Dict[str, Any]:
         """Return host information."""
+        openpeerpower = self.sys_openpeerpower
         return {
-            ATTR_VERSION: self.sys_openpeerpower.version,
-            ATTR_VERSION_LATEST: self.sys_openpeerpower.latest_version,
-            ATTR_UPDATE_AVAILABLE: self.sys_openpeerpower.need_update,
-            ATTR_MACHINE: self.sys_openpeerpower.machine,
-            ATTR_IP_ADDRESS: str(self.sys_openpeerpower.ip_address),
-            ATTR_ARCH: self.sys_openpeerpower.arch,
-            ATTR_IMAGE: self.sys_openpeerpower.image,
-            ATTR_BOOT: self.sys_openpeerpower.boot,
-            ATTR_PORT: self.sys_openpeerpower.api_port,
-            ATTR_SSL: self.sys_openpeerpower.api_ssl,
-            ATTR_WATCHDOG: self.sys_openpeerpower.watchdog,
-            ATTR_WAIT_BOOT: self.sys_openpeerpower.wait_boot,
-            ATTR_AUDIO_INPUT: self.sys_openpeerpower.audio_input,
-            ATTR_AUDIO_OUTPUT: self.sys_openpeerpower.audio_output,
+            ATTR_VERSION: openpeerpower.version,
+            ATTR_VERSION_LATEST: openpeerpower.latest_version,
+            ATTR_UPDATE_AVAILABLE: openpeerpower.need_update,
+            ATTR_MACHINE: openpeerpower.machine,
+            ATTR_IP_ADDRESS: str(openpeerpower.ip_address),
+            ATTR_ARCH: openpeerpower.arch,
+            ATTR_IMAGE: openpeerpower.image,
+            ATTR_BOOT: openpeerpower.boot,
+            ATTR_PORT: openpeerpower.api_port,
+            ATTR_SSL: openpeerpower.api_ssl,
+            ATTR_WATCHDOG: openpeerpower.watchdog,
+            ATTR_WAIT_BOOT: openpeerpower.wait_boot,
+            ATTR_AUDIO_INPUT: openpeerpower.audio_input,
+            ATTR_AUDIO_OUTPUT: openpeerpower.audio_output,
             # Remove end of Q3 2020
-            "last_version": self.sys_openpeerpower.latest_version,
+            "last_version": openpeerpower.latest_version,
         }
 
     @api_process
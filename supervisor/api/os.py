@@ -28,11 +28,12 @@ class APIOS(CoreSysAttributes):
     @api_process
     async def info(self, request: web.Request) -> Dict[str, Any]:
         """Return OS information."""
+        oppos = self.sys_oppos
         return {
-            ATTR_VERSION: self.sys_oppos.version,
-            ATTR_VERSION_LATEST: self.sys_oppos.latest_version,
-            ATTR_UPDATE_AVAILABLE: self.sys_oppos.need_update,
-            ATTR_BOARD: self.sys_oppos.board,
+            ATTR_VERSION: oppos.version,
+            ATTR_VERSION_LATEST: oppos.latest_version,
+            ATTR_UPDATE_AVAILABLE: oppos.need_update,
+            ATTR_BOARD: oppos.board,
             ATTR_BOOT: self.sys_dbus.rauc.boot_slot,
         }
 
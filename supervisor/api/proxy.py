@@ -2,6 +2,7 @@
 import asyncio
 from contextlib import asynccontextmanager
 import logging
+import time
 
 import aiohttp
 from aiohttp import web
@@ -11,6 +12,7 @@ from aiohttp.web_exceptions import HTTPBadGateway, HTTPUnauthorized
 
 from ..coresys import CoreSysAttributes
 from ..exceptions import APIError, OpenPeerPowerAPIError, OpenPeerPowerAuthError
+from .utils import websocket_forward
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -18,15 +20,31 @@ _LOGGER: logging.Logger = logging.getLogger(__name__)
 FORWARD_HEADERS = ("X-Speech-Content",)
 HEADER_HA_ACCESS = "X-Ha-Access"
 
+API_STATE_CACHE_SECONDS = 2.0
+
 
 class APIProxy(CoreSysAttributes):
     """API Proxy for Open Peer Power."""
 
+    _api_state_ok: float = 0.0
+
+    async def _check_api_state(self) -> bool:
+        """Return True if Open Peer Power API is up, cache success shortly."""
+        now = time.monotonic()
+        if now - self._api_state_ok < API_STATE_CACHE_SECONDS:
+            return True
+
+        if not await self.sys_openpeerpower.api.check_api_state():
+            return False
+
+        self._api_state_ok = now
+        return True
+
     def _check_access(self, request: web.Request):
         """Check the Supervisor token."""
-        if AUTHORIZATION in request.headers:
-            bearer = request.headers[AUTHORIZATION]
-            supervisor_token = bearer.split(" ")[-1]
+        bearer = request.headers.get(AUTHORIZATION)
+        if bearer is not None:
+            supervisor_token = bearer.rpartition(" ")[2]
         else:
             supervisor_token = request.headers.get(HEADER_HA_ACCESS)
 
@@ -49,9 +67,9 @@ class APIProxy(CoreSysAttributes):
                 request.method.lower(),
                 f"api/{path}",
                 headers={
-                    name: value
-                    for name, value in request.headers.items()
-                    if name in FORWARD_HEADERS
+                    name: request.headers[name]
+                    for name in FORWARD_HEADERS
+                    if name in request.headers
                 },
                 content_type=request.content_type,
                 data=request.content,
@@ -75,7 +93,7 @@ class APIProxy(CoreSysAttributes):
     async def stream(self, request: web.Request):
         """Proxy OpenPeerPower EventStream Requests."""
         self._check_access(request)
-        if not await self.sys_openpeerpower.api.check_api_state():
+        if not await self._check_api_state():
             raise HTTPBadGateway()
 
         _LOGGER.info("Open Peer Power EventStream start")
@@ -84,7 +102,7 @@ class APIProxy(CoreSysAttributes):
             response.content_type = request.headers.get(CONTENT_TYPE)
             try:
                 await response.prepare(request)
-                async for data in client.content:
+                async for data in client.content.iter_any():
                     await response.write(data)
 
             except (aiohttp.ClientError, aiohttp.ClientPayloadError):
@@ -96,62 +114,81 @@ class APIProxy(CoreSysAttributes):
     async def api(self, request: web.Request):
         """Proxy Open Peer Power API Requests."""
         self._check_access(request)
-        if not await self.sys_openpeerpower.api.check_api_state():
+        if not await self._check_api_state():
             raise HTTPBadGateway()
 
         # Normal request
         path = request.match_info.get("path", "")
         async with self._api_client(request, path) as client:
-            data = await client.read()
-            return web.Response(
-                body=data, status=client.status, content_type=client.content_type
-            )
+            response = web.StreamResponse(status=client.status)
+            response.content_type = client.content_type
+            try:
+                await response.prepare(request)
+                async for data in client.content.iter_any():
+                    await response.write(data)
+
+            except (aiohttp.ClientError, aiohttp.ClientPayloadError) as err:
+                _LOGGER.error("Client error on API request %s: %s", path, err)
+            except asyncio.TimeoutError:
+                _LOGGER.error("Client timeout error on API request %s", path)
+            else:
+                return response
+
+            # Status is already sent, abort so the client sees the truncation
+            if request.transport:
+                request.transport.close()
+            return response
 
     async def _websocket_client(self):
         """Initialize a WebSocket API connection."""
         url = f"{self.sys_openpeerpower.api_url}/api/websocket"
+        websession = self.sys_websession_ssl
+        opp_api = self.sys_openpeerpower.api
 
         try:
-            client = await self.sys_websession_ssl.ws_connect(
-                url, heartbeat=30, verify_ssl=False
-            )
-
-            # Handle authentication
-            data = await client.receive_json()
-
-            if data.get("type") == "auth_ok":
-                return client
+            # Retry once with a fresh access token if the current one is invalid
+            for attempt in range(2):
+                client = await websession.ws_connect(
+                    url, heartbeat=30, verify_ssl=False
+                )
 
-            if data.get("type") != "auth_required":
-                # Invalid protocol
-                _LOGGER.error(
-                    "Got unexpected response from Open Peer Power WebSocket: %s", data
+                # Handle authentication
+                data = await client.receive_json()
+
+                if data.get("type") == "auth_ok":
+                    return client
+
+                if data.get("type") != "auth_required":
+                    # Invalid protocol
+                    _LOGGER.error(
+                        "Got unexpected response from Open Peer Power WebSocket: %s",
+                        data,
+                    )
+                    await client.close()
+                    raise APIError()
+
+                # Auth session
+                await opp_api.ensure_access_token()
+                await client.send_json(
+                    {"type": "auth", "access_token": opp_api.access_token}
                 )
-                raise APIError()
-
-            # Auth session
-            await self.sys_openpeerpower.api.ensure_access_token()
-            await client.send_json(
-                {
-                    "type": "auth",
-                    "access_token": self.sys_openpeerpower.api.access_token,
-                }
-            )
 
-            data = await client.receive_json()
+                data = await client.receive_json()
 
-            if data.get("type") == "auth_ok":
-                return client
+                if data.get("type") == "auth_ok":
+                    return client
+                await client.close()
 
-            # Renew the Token is invalid
-            if (
-                data.get("type") == "invalid_auth"
-                and self.sys_openpeerpower.refresh_token
-            ):
-                self.sys_openpeerpower.api.access_token = None
-                return await self._websocket_client()
+                # Renew the Token is invalid
+                if (
+                    attempt == 0
+                    and data.get("type") == "invalid_auth"
+                    and self.sys_openpeerpower.refresh_token
+                ):
+                    opp_api.access_token = None
+                    continue
 
-            raise OpenPeerPowerAuthError()
+                raise OpenPeerPowerAuthError()
 
         except (RuntimeError, ValueError, TypeError, ClientConnectorError) as err:
             _LOGGER.error("Client error on WebSocket API %s.", err)
@@ -162,7 +199,7 @@ class APIProxy(CoreSysAttributes):
 
     async def websocket(self, request: web.Request):
         """Initialize a WebSocket API connection."""
-        if not await self.sys_openpeerpower.api.check_api_state():
+        if not await self._check_api_state():
             raise HTTPBadGateway()
         _LOGGER.info("Open Peer Power WebSocket API request initialize")
 
@@ -206,43 +243,20 @@ class APIProxy(CoreSysAttributes):
             return server
 
         _LOGGER.info("Open Peer Power WebSocket API request running")
+        proxy_tasks = [
+            self.sys_create_task(websocket_forward(client, server)),
+            self.sys_create_task(websocket_forward(server, client)),
+        ]
         try:
-            client_read = None
-            server_read = None
-            while not server.closed and not client.closed:
-                if not client_read:
-                    client_read = self.sys_create_task(client.receive_str())
-                if not server_read:
-                    server_read = self.sys_create_task(server.receive_str())
-
-                # wait until data need to be processed
-                await asyncio.wait(
-                    [client_read, server_read], return_when=asyncio.FIRST_COMPLETED
-                )
-
-                # server
-                if server_read.done() and not client.closed:
-                    server_read.exception()
-                    await client.send_str(server_read.result())
-                    server_read = None
-
-                # client
-                if client_read.done() and not server.closed:
-                    client_read.exception()
-                    await server.send_str(client_read.result())
-                    client_read = None
+            # Stop proxy if one side is closed
+            await asyncio.wait(proxy_tasks, return_when=asyncio.FIRST_COMPLETED)
 
         except asyncio.CancelledError:
             pass
 
-        except (RuntimeError, ConnectionError, TypeError) as err:
-            _LOGGER.info("Open Peer Power WebSocket API error: %s", err)
-
         finally:
-            if client_read:
-                client_read.cancel()
-            if server_read:
-                server_read.cancel()
+            for task in proxy_tasks:
+                task.cancel()
 
             # close connections
             if not client.closed:
@@ -1,8 +1,9 @@
 """Init file for Supervisor util for RESTful API."""
 import json
+import logging
 from typing import Any, Dict, List, Optional
 
-from aiohttp import web
+from aiohttp import WSMsgType, web
 from aiohttp.hdrs import AUTHORIZATION
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
@@ -22,6 +23,8 @@ from ..utils import check_exception_chain, get_message_from_exception_chain
 from ..utils.json import JSONEncoder
 from ..utils.log_format import format_message
 
+_LOGGER: logging.Logger = logging.getLogger(__name__)
+
 
 def excract_supervisor_token(request: web.Request) -> Optional[str]:
     """Extract Supervisor token from request."""
@@ -144,3 +147,21 @@ async def api_validate(
         data_validated[origin_value] = data[origin_value]
 
     return data_validated
+
+
+async def websocket_forward(ws_from, ws_to) -> None:
+    """Forward websocket messages until one side is closed."""
+    try:
+        async for msg in ws_from:
+            if msg.type == WSMsgType.TEXT:
+                await ws_to.send_str(msg.data)
+            elif msg.type == WSMsgType.BINARY:
+                await ws_to.send_bytes(msg.data)
+            elif msg.type == WSMsgType.PING:
+                await ws_to.ping()
+            elif msg.type == WSMsgType.PONG:
+                await ws_to.pong()
+            elif ws_to.closed:
+                await ws_to.close(code=ws_to.close_code, message=msg.extra)
+    except (RuntimeError, ConnectionError, TypeError) as err:
+        _LOGGER.info("Websocket forward closed with error: %s", err)
@@ -25,7 +25,7 @@ CMD_NEW = "post"
 CMD_DEL = "delete"
 
 
-@attr.s
+@attr.s(slots=True)
 class Message:
     """Represent a single Discovery message."""
 
@@ -3,7 +3,7 @@ from contextlib import suppress
 from ipaddress import IPv4Address
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 import attr
 from awesomeversion import AwesomeVersion
@@ -191,6 +191,22 @@ class DockerAPI:
 
         return container
 
+    def running_containers(self) -> Set[str]:
+        """Return names of all running containers with a single request.
+
+        Need run inside executor.
+        """
+        try:
+            containers = self.api.containers(filters={"status": "running"})
+        except docker.errors.DockerException as err:
+            raise DockerAPIError() from err
+        except requests.RequestException as err:
+            raise DockerRequestError() from err
+
+        return {
+            name.lstrip("/") for container in containers for name in container["Names"]
+        }
+
     def run_command(
         self,
         image: str,
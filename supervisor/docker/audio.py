@@ -1,4 +1,5 @@
 """Audio docker object."""
+from functools import cached_property
 import logging
 from pathlib import Path
 from typing import Dict
@@ -25,9 +26,9 @@ class DockerAudio(DockerInterface, CoreSysAttributes):
         """Return name of Docker container."""
         return AUDIO_DOCKER_NAME
 
-    @property
-    def volumes(self) -> Dict[str, Dict[str, str]]:
-        """Return Volumes for the mount."""
+    @cached_property
+    def _static_volumes(self) -> Dict[str, Dict[str, str]]:
+        """Return Volumes that are fixed while the Supervisor runs."""
         volumes = {
             str(self.sys_config.path_extern_audio): {"bind": "/data", "mode": "rw"},
             "/run/dbus": {"bind": "/run/dbus", "mode": "ro"},
@@ -37,7 +38,14 @@ class DockerAudio(DockerInterface, CoreSysAttributes):
         if MACHINE_ID.exists():
             volumes.update({str(MACHINE_ID): {"bind": str(MACHINE_ID), "mode": "ro"}})
 
-        # SND support
+        return volumes
+
+    @property
+    def volumes(self) -> Dict[str, Dict[str, str]]:
+        """Return Volumes for the mount."""
+        volumes = self._static_volumes.copy()
+
+        # SND support, a sound card or module can show up after boot
         if Path("/dev/snd").exists():
             volumes.update({"/dev/snd": {"bind": "/dev/snd", "mode": "rw"}})
         else:
@@ -1,4 +1,5 @@
 """Init file for Supervisor Docker object."""
+from functools import cached_property
 from ipaddress import IPv4Address
 import logging
 from typing import Awaitable, Dict, Optional
@@ -7,7 +8,7 @@ import docker
 import requests
 
 from ..const import ENV_TIME, ENV_TOKEN, ENV_TOKEN_OPPIO, LABEL_MACHINE, MACHINE_ID
-from ..exceptions import DockerError
+from ..exceptions import DockerAPIError, DockerRequestError
 from .interface import CommandReturn, DockerInterface
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -21,9 +22,7 @@ class DockerOpenPeerPower(DockerInterface):
     @property
     def machine(self) -> Optional[str]:
         """Return machine of Open Peer Power Docker image."""
-        if self._meta and LABEL_MACHINE in self._meta["Config"]["Labels"]:
-            return self._meta["Config"]["Labels"][LABEL_MACHINE]
-        return None
+        return self.meta_labels.get(LABEL_MACHINE)
 
     @property
     def image(self) -> str:
@@ -45,9 +44,12 @@ class DockerOpenPeerPower(DockerInterface):
         """Return IP address of this container."""
         return self.sys_docker.network.gateway
 
-    @property
+    @cached_property
     def volumes(self) -> Dict[str, Dict[str, str]]:
-        """Return Volumes for the mount."""
+        """Return Volumes for the mount.
+
+        Only Supervisor config paths and machine-id, cached after first use.
+        """
         volumes = {"/run/dbus": {"bind": "/run/dbus", "mode": "ro"}}
 
         # Add folders
@@ -178,11 +180,14 @@ class DockerOpenPeerPower(DockerInterface):
             )
         except docker.errors.NotFound:
             return False
-        except (docker.errors.DockerException, requests.RequestException):
-            return DockerError()
+        except docker.errors.DockerException as err:
+            raise DockerAPIError() from err
+        except requests.RequestException as err:
+            raise DockerRequestError() from err
 
         # we run on an old image, stop and start it
-        if docker_container.image.id != docker_image.id:
+        # Container.image would fetch the image again, inspect data has the id
+        if docker_container.attrs["Image"] != docker_image.id:
             return False
 
         # Check of correct state
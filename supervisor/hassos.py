@@ -1,12 +1,12 @@
 """OppOS support on supervisor."""
 import asyncio
+from functools import partial
 import logging
 from pathlib import Path
 from typing import Awaitable, Optional
 
 import aiohttp
 from awesomeversion import AwesomeVersion, AwesomeVersionException
-from cpe import CPE
 
 from .coresys import CoreSys, CoreSysAttributes
 from .dbus.rauc import RaucState
@@ -15,6 +15,8 @@ from .utils import process_lock
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+OTA_CHUNK_SIZE = 4_194_304
+
 
 class OppOS(CoreSysAttributes):
     """OppOS interface inside supervisor."""
@@ -77,13 +79,10 @@ class OppOS(CoreSysAttributes):
                 if request.status != 200:
                     raise OppOSUpdateError()
 
-                # Download RAUCB file
+                # Download RAUCB file, disk writes don't block the event loop
                 with raucb.open("wb") as ota_file:
-                    while True:
-                        chunk = await request.content.read(1_048_576)
-                        if not chunk:
-                            break
-                        ota_file.write(chunk)
+                    async for chunk in request.content.iter_chunked(OTA_CHUNK_SIZE):
+                        await self.sys_run_in_executor(ota_file.write, chunk)
 
             _LOGGER.info("OTA update is downloaded on %s", raucb)
             return raucb
@@ -102,6 +101,9 @@ class OppOS(CoreSysAttributes):
             if not self.sys_host.info.cpe:
                 raise NotImplementedError()
 
+            # pylint: disable=import-outside-toplevel
+            from cpe import CPE
+
             cpe = CPE(self.sys_host.info.cpe)
             if cpe.get_product()[0] != "oppos":
                 raise NotImplementedError()
@@ -149,16 +151,21 @@ class OppOS(CoreSysAttributes):
         int_ota = await self._download_raucb(version)
         ext_ota = Path(self.sys_config.path_extern_tmp, int_ota.name)
 
+        # Wait for the completed signal concurrently with the install call
+        completed_task = None
         try:
+            completed_task = self.sys_create_task(self.sys_dbus.rauc.signal_completed())
             await self.sys_dbus.rauc.install(ext_ota)
-            completed = await self.sys_dbus.rauc.signal_completed()
+            completed = await completed_task
 
         except DBusError as err:
             _LOGGER.error("Rauc communication error")
             raise OppOSUpdateError() from err
 
         finally:
-            int_ota.unlink()
+            if completed_task:
+                completed_task.cancel()
+            await self.sys_run_in_executor(partial(int_ota.unlink, missing_ok=True))
 
         # Update success
         if 0 in completed:
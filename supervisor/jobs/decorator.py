@@ -104,19 +104,18 @@ class Job:
             )
             return False
 
-        if (
-            JobCondition.FREE_SPACE in used_conditions
-            and self._coresys.host.info.free_space < MINIMUM_FREE_SPACE_THRESHOLD
-        ):
-            _LOGGER.warning(
-                "'%s' blocked from execution, not enough free space (%sGB) left on the device",
-                self._method.__qualname__,
-                self._coresys.host.info.free_space,
-            )
-            self._coresys.resolution.create_issue(
-                IssueType.FREE_SPACE, ContextType.SYSTEM
-            )
-            return False
+        if JobCondition.FREE_SPACE in used_conditions:
+            free_space = self._coresys.host.info.free_space
+            if free_space < MINIMUM_FREE_SPACE_THRESHOLD:
+                _LOGGER.warning(
+                    "'%s' blocked from execution, not enough free space (%sGB) left on the device",
+                    self._method.__qualname__,
+                    free_space,
+                )
+                self._coresys.resolution.create_issue(
+                    IssueType.FREE_SPACE, ContextType.SYSTEM
+                )
+                return False
 
         if (
             JobCondition.INTERNET_SYSTEM in self.conditions
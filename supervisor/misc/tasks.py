@@ -216,10 +216,10 @@ class Tasks(CoreSysAttributes):
         retry_scan = self._cache.get(OPP_WATCHDOG_API, 0)
 
         # If Open-Peer-Power API is up
-        if (
-            self.sys_openpeerpower.core.in_progress
-            or await self.sys_openpeerpower.api.check_api_state()
-        ):
+        if self.sys_openpeerpower.core.in_progress:
+            return
+        if await self.sys_openpeerpower.api.check_api_state():
+            self._cache.pop(OPP_WATCHDOG_API, None)
             return
 
         # Look like we run into a problem
@@ -236,7 +236,7 @@ class Tasks(CoreSysAttributes):
             _LOGGER.error("Open Peer Power watchdog reanimation failed!")
             self.sys_capture_exception(err)
         finally:
-            self._cache[OPP_WATCHDOG_API] = 0
+            self._cache.pop(OPP_WATCHDOG_API, None)
 
     @Job(conditions=JobCondition.RUNNING)
     async def _update_cli(self):
@@ -386,9 +386,16 @@ class Tasks(CoreSysAttributes):
 
     async def _watchdog_addon_docker(self):
         """Check running state  of Docker and start if they is close."""
-        for addon in self.sys_addons.installed:
-            # if watchdog need looking for
-            if not addon.watchdog or await addon.is_running():
+        addons = [addon for addon in self.sys_addons.installed if addon.watchdog]
+        if not addons:
+            return
+
+        # One Docker request for all add-ons
+        running = await self.sys_run_in_executor(self.sys_docker.running_containers)
+
+        for addon in addons:
+            # if Addon container is running
+            if addon.instance.name in running:
                 continue
 
             # if Addon have running actions
@@ -413,7 +420,10 @@ class Tasks(CoreSysAttributes):
             retry_scan = self._cache.get(addon.slug, 0)
 
             # if Addon have running actions / Application work
-            if addon.in_progress or await addon.watchdog_application():
+            if addon.in_progress:
+                continue
+            if await addon.watchdog_application():
+                self._cache.pop(addon.slug, None)
                 continue
 
             # Look like we run into a problem
@@ -423,7 +433,7 @@ class Tasks(CoreSysAttributes):
                 _LOGGER.warning(
                     "Watchdog missing application response from %s", addon.slug
                 )
-                return
+                continue
 
             _LOGGER.warning("Watchdog found a problem with %s application!", addon.slug)
             try:
@@ -432,17 +442,24 @@ class Tasks(CoreSysAttributes):
                 _LOGGER.error("%s watchdog reanimation failed with %s", addon.slug, err)
                 self.sys_capture_exception(err)
             finally:
-                self._cache[addon.slug] = 0
+                self._cache.pop(addon.slug, None)
 
     async def _refresh_addon(self) -> None:
         """Refresh addon state."""
-        for addon in self.sys_addons.installed:
-            # if watchdog need looking for
-            if addon.watchdog or addon.state != AddonState.STARTED:
-                continue
+        addons = [
+            addon
+            for addon in self.sys_addons.installed
+            if not addon.watchdog and addon.state == AddonState.STARTED
+        ]
+        if not addons:
+            return
+
+        # One Docker request for all add-ons
+        running = await self.sys_run_in_executor(self.sys_docker.running_containers)
 
+        for addon in addons:
             # if Addon have running actions
-            if addon.in_progress or await addon.is_running():
+            if addon.in_progress or addon.instance.name in running:
                 continue
 
             # Adjust state
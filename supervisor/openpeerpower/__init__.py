@@ -103,9 +103,8 @@ class OpenPeerPower(JsonConfig, CoreSysAttributes):
     @property
     def api_url(self) -> str:
         """Return API url to Open Peer Power."""
-        return "{}://{}:{}".format(
-            "https" if self.api_ssl else "http", self.ip_address, self.api_port
-        )
+        scheme = "https" if self.api_ssl else "http"
+        return f"{scheme}://{self.ip_address}:{self.api_port}"
 
     @property
     def watchdog(self) -> bool:
@@ -229,7 +228,7 @@ class OpenPeerPower(JsonConfig, CoreSysAttributes):
 
     async def load(self) -> None:
         """Prepare Open Peer Power object."""
-        await asyncio.wait([self.secrets.load(), self.core.load()])
+        await asyncio.gather(self.secrets.load(), self.core.load())
 
     def write_pulse(self):
         """Write asound config to file and return True on success."""
@@ -24,13 +24,18 @@ from ..exceptions import (
 )
 from ..jobs.decorator import Job, JobCondition
 from ..resolution.const import ContextType, IssueType
-from ..utils import convert_to_ascii, process_lock
+from ..utils import convert_to_ascii, process_lock, retry_backoff
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 RE_YAML_ERROR = re.compile(r"openpeerpower\.util\.yaml")
 
 LANDINGPAGE: AwesomeVersion = AwesomeVersion("landingpage")
+EARLY_UI_VERSION: AwesomeVersion = AwesomeVersion("0.112.0")
+
+BLOCK_POLL_MIN = 0.25
+BLOCK_POLL_MAX = 5.0
+BLOCK_POLL_FACTOR = 1.5
 
 
 @attr.s(frozen=True)
@@ -68,7 +73,8 @@ class OpenPeerPowerCore(CoreSysAttributes):
             await self.instance.attach(tag=self.sys_openpeerpower.version)
         except DockerError:
             _LOGGER.info(
-                "No Open Peer Power Docker image %s found.", self.sys_openpeerpower.image
+                "No Open Peer Power Docker image %s found.",
+                self.sys_openpeerpower.image,
             )
             await self.install_landingpage()
         else:
@@ -89,12 +95,16 @@ class OpenPeerPowerCore(CoreSysAttributes):
     async def install_landingpage(self) -> None:
         """Install a landing page."""
         _LOGGER.info("Setting up Open Peer Power landingpage")
+        attempt = 0
         while True:
             if not self.sys_updater.image_openpeerpower:
+                delay = retry_backoff(attempt)
+                attempt += 1
                 _LOGGER.warning(
-                    "Found no information about Open Peer Power. Retry in 30sec"
+                    "Found no information about Open Peer Power. Retry in %.1fsec",
+                    delay,
                 )
-                await asyncio.sleep(30)
+                await asyncio.sleep(delay)
                 await self.sys_updater.reload()
                 continue
 
@@ -103,8 +113,10 @@ class OpenPeerPowerCore(CoreSysAttributes):
                     LANDINGPAGE, image=self.sys_updater.image_openpeerpower
                 )
             except DockerError:
-                _LOGGER.warning("Fails install landingpage, retry after 30sec")
-                await asyncio.sleep(30)
+                delay = retry_backoff(attempt)
+                attempt += 1
+                _LOGGER.warning("Fails install landingpage, retry after %.1fsec", delay)
+                await asyncio.sleep(delay)
             except Exception as err:  # pylint: disable=broad-except
                 self.sys_capture_exception(err)
             else:
@@ -117,6 +129,7 @@ class OpenPeerPowerCore(CoreSysAttributes):
     async def install(self) -> None:
         """Install a landing page."""
         _LOGGER.info("Open Peer Power setup")
+        attempt = 0
         while True:
             # read openpeerpower tag and install it
             if not self.sys_openpeerpower.latest_version:
@@ -134,8 +147,12 @@ class OpenPeerPowerCore(CoreSysAttributes):
                 except Exception as err:  # pylint: disable=broad-except
                     self.sys_capture_exception(err)
 
-            _LOGGER.warning("Error on Open Peer Power installation. Retry in 30sec")
-            await asyncio.sleep(30)
+            delay = retry_backoff(attempt)
+            attempt += 1
+            _LOGGER.warning(
+                "Error on Open Peer Power installation. Retry in %.1fsec", delay
+            )
+            await asyncio.sleep(delay)
 
         _LOGGER.info("Open Peer Power docker now installed")
         self.sys_openpeerpower.version = self.instance.version
@@ -217,7 +234,7 @@ class OpenPeerPowerCore(CoreSysAttributes):
                     self.sys_config.path_openpeerpower / "openpeerpower-rollback.log"
                 )
 
-                shutil.copy(logfile, backup)
+                await self.sys_run_in_executor(shutil.copy, logfile, backup)
                 _LOGGER.info(
                     "A backup of the logfile is stored in /config/openpeerpower-rollback.log"
                 )
@@ -249,8 +266,13 @@ class OpenPeerPowerCore(CoreSysAttributes):
             _LOGGER.warning("Open Peer Power is already running!")
             return
 
+        try:
+            initialized = await self.instance.is_initialize()
+        except DockerError as err:
+            raise OpenPeerPowerError() from err
+
         # Instance/Container exists, simple start
-        if await self.instance.is_initialize():
+        if initialized:
             try:
                 await self.instance.start()
             except DockerError as err:
@@ -360,7 +382,7 @@ class OpenPeerPowerCore(CoreSysAttributes):
         start_time = time.monotonic()
         with suppress(AwesomeVersionException):
             # Version provide early stage UI
-            if version >= AwesomeVersion("0.112.0"):
+            if version >= EARLY_UI_VERSION:
                 _LOGGER.debug("Disable startup timeouts - early UI")
                 timeout = False
 
@@ -372,16 +394,24 @@ class OpenPeerPowerCore(CoreSysAttributes):
         pip_progress = False
         pip_file = Path(self.sys_config.path_openpeerpower, ".pip_progress")
 
+        poll_interval = BLOCK_POLL_MIN
         while True:
-            await asyncio.sleep(5)
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(BLOCK_POLL_MAX, poll_interval * BLOCK_POLL_FACTOR)
+
+            # Container and API state are independent, probe them together
+            running, api_state = await asyncio.gather(
+                self.instance.is_running(),
+                self.sys_openpeerpower.api.check_api_state(),
+            )
 
             # 1: Check if Container is is_running
-            if not await self.instance.is_running():
+            if not running:
                 _LOGGER.error("Open Peer Power has crashed!")
                 break
 
             # 2: Check if API response
-            if await self.sys_openpeerpower.api.check_api_state():
+            if api_state:
                 _LOGGER.info("Detect a running Open Peer Power instance")
                 self._error_state = False
                 return
@@ -395,6 +425,7 @@ class OpenPeerPowerCore(CoreSysAttributes):
             if migration_progress:
                 migration_progress = False  # Reset start time
                 start_time = time.monotonic()
+                poll_interval = BLOCK_POLL_MIN
                 _LOGGER.info("Open Peer Power record migration done")
 
             # 4: Running PIP installation
@@ -406,6 +437,7 @@ class OpenPeerPowerCore(CoreSysAttributes):
             if pip_progress:
                 pip_progress = False  # Reset start time
                 start_time = time.monotonic()
+                poll_interval = BLOCK_POLL_MIN
                 _LOGGER.info("Open Peer Power pip installation done")
 
             # 5: Timeout
@@ -19,6 +19,7 @@ class OpenPeerPowerSecrets(CoreSysAttributes):
         """Initialize secret manager."""
         self.coresys: CoreSys = coresys
         self.secrets: Dict[str, Union[bool, float, int, str]] = {}
+        self._mtime: Optional[int] = None
 
     @property
     def path_secrets(self) -> Path:
@@ -27,7 +28,7 @@ class OpenPeerPowerSecrets(CoreSysAttributes):
 
     def get(self, secret: str) -> Optional[Union[bool, float, int, str]]:
         """Get secret from store."""
-        _LOGGER.info("Request secret %s", secret)
+        _LOGGER.debug("Request secret %s", secret)
         return self.secrets.get(secret)
 
     async def load(self) -> None:
@@ -43,10 +44,16 @@ class OpenPeerPowerSecrets(CoreSysAttributes):
     @AsyncThrottle(timedelta(seconds=60))
     async def _read_secrets(self):
         """Read secrets.yaml into memory."""
-        if not self.path_secrets.exists():
+        try:
+            mtime = self.path_secrets.stat().st_mtime_ns
+        except FileNotFoundError:
             _LOGGER.debug("Open Peer Power secrets not exists")
             return
 
+        # Skip parsing if file is unchanged
+        if mtime == self._mtime:
+            return
+
         # Read secrets
         try:
             yaml = YAML()
@@ -61,4 +68,5 @@ class OpenPeerPowerSecrets(CoreSysAttributes):
         except (YAMLError, AttributeError) as err:
             _LOGGER.error("Can't process Open Peer Power secrets: %s", err)
         else:
+            self._mtime = mtime
             _LOGGER.debug("Reloading Open Peer Power secrets: %s", len(self.secrets))
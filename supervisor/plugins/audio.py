@@ -16,6 +16,7 @@ from ..coresys import CoreSys
 from ..docker.audio import DockerAudio
 from ..docker.stats import DockerStats
 from ..exceptions import AudioError, AudioUpdateError, DockerError
+from ..utils import retry_backoff
 from .base import PluginBase
 from .const import FILE_OPPIO_AUDIO
 from .validate import SCHEMA_AUDIO_CONFIG
@@ -99,6 +100,7 @@ class PluginAudio(PluginBase):
     async def install(self) -> None:
         """Install Audio."""
         _LOGGER.info("Setup Audio plugin")
+        attempt = 0
         while True:
             # read audio tag and install it
             if not self.latest_version:
@@ -110,8 +112,12 @@ class PluginAudio(PluginBase):
                         self.latest_version, image=self.sys_updater.image_audio
                     )
                     break
-            _LOGGER.warning("Error on installing Audio plugin, retrying in 30sec")
-            await asyncio.sleep(30)
+            delay = retry_backoff(attempt)
+            attempt += 1
+            _LOGGER.warning(
+                "Error on installing Audio plugin, retrying in %.1fsec", delay
+            )
+            await asyncio.sleep(delay)
 
         _LOGGER.info("Audio plugin now installed")
         self.version = self.instance.version
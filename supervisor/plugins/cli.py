@@ -15,6 +15,7 @@ from ..coresys import CoreSys
 from ..docker.cli import DockerCli
 from ..docker.stats import DockerStats
 from ..exceptions import CliError, CliUpdateError, DockerError
+from ..utils import retry_backoff
 from .base import PluginBase
 from .const import FILE_OPPIO_CLI
 from .validate import SCHEMA_CLI_CONFIG
@@ -75,6 +76,7 @@ class PluginCli(PluginBase):
     async def install(self) -> None:
         """Install cli."""
         _LOGGER.info("Running setup for CLI plugin")
+        attempt = 0
         while True:
             # read audio tag and install it
             if not self.latest_version:
@@ -87,8 +89,10 @@ class PluginCli(PluginBase):
                         image=self.sys_updater.image_cli,
                     )
                     break
-            _LOGGER.warning("Error on install cli plugin. Retry in 30sec")
-            await asyncio.sleep(30)
+            delay = retry_backoff(attempt)
+            attempt += 1
+            _LOGGER.warning("Error on install cli plugin. Retry in %.1fsec", delay)
+            await asyncio.sleep(delay)
 
         _LOGGER.info("CLI plugin is now installed")
         self.version = self.instance.version
@@ -20,6 +20,7 @@ from ..docker.dns import DockerDNS
 from ..docker.stats import DockerStats
 from ..exceptions import CoreDNSError, CoreDNSUpdateError, DockerError, JsonFileError
 from ..resolution.const import ContextType, IssueType, SuggestionType
+from ..utils import retry_backoff
 from ..utils.json import write_json_file
 from ..validate import dns_url
 from .base import PluginBase
@@ -142,6 +143,7 @@ class PluginDns(PluginBase):
     async def install(self) -> None:
         """Install CoreDNS."""
         _LOGGER.info("Running setup for CoreDNS plugin")
+        attempt = 0
         while True:
             # read openpeerpower tag and install it
             if not self.latest_version:
@@ -153,8 +155,10 @@ class PluginDns(PluginBase):
                         self.latest_version, image=self.sys_updater.image_dns
                     )
                     break
-            _LOGGER.warning("Error on install CoreDNS plugin. Retry in 30sec")
-            await asyncio.sleep(30)
+            delay = retry_backoff(attempt)
+            attempt += 1
+            _LOGGER.warning("Error on install CoreDNS plugin. Retry in %.1fsec", delay)
+            await asyncio.sleep(delay)
 
         _LOGGER.info("CoreDNS plugin now installed")
         self.version = self.instance.version
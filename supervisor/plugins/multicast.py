@@ -13,6 +13,7 @@ from ..coresys import CoreSys
 from ..docker.multicast import DockerMulticast
 from ..docker.stats import DockerStats
 from ..exceptions import DockerError, MulticastError, MulticastUpdateError
+from ..utils import retry_backoff
 from .base import PluginBase
 from .const import FILE_OPPIO_MULTICAST
 from .validate import SCHEMA_MULTICAST_CONFIG
@@ -70,6 +71,7 @@ class PluginMulticast(PluginBase):
     async def install(self) -> None:
         """Install Multicast."""
         _LOGGER.info("Running setup for Multicast plugin")
+        attempt = 0
         while True:
             # read openpeerpower tag and install it
             if not self.latest_version:
@@ -81,8 +83,12 @@ class PluginMulticast(PluginBase):
                         self.latest_version, image=self.sys_updater.image_multicast
                     )
                     break
-            _LOGGER.warning("Error on install Multicast plugin. Retry in 30sec")
-            await asyncio.sleep(30)
+            delay = retry_backoff(attempt)
+            attempt += 1
+            _LOGGER.warning(
+                "Error on install Multicast plugin. Retry in %.1fsec", delay
+            )
+            await asyncio.sleep(delay)
 
         _LOGGER.info("Multicast plugin is now installed")
         self.version = self.instance.version
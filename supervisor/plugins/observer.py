@@ -16,6 +16,7 @@ from ..coresys import CoreSys
 from ..docker.observer import DockerObserver
 from ..docker.stats import DockerStats
 from ..exceptions import DockerError, ObserverError, ObserverUpdateError
+from ..utils import retry_backoff
 from .base import PluginBase
 from .const import FILE_OPPIO_OBSERVER
 from .validate import SCHEMA_OBSERVER_CONFIG
@@ -78,6 +79,7 @@ class PluginObserver(PluginBase):
     async def install(self) -> None:
         """Install observer."""
         _LOGGER.info("Running setup for observer plugin")
+        attempt = 0
         while True:
             # read observer tag and install it
             if not self.latest_version:
@@ -89,8 +91,10 @@ class PluginObserver(PluginBase):
                         self.latest_version, image=self.sys_updater.image_observer
                     )
                     break
-            _LOGGER.warning("Error on install observer plugin. Retry in 30sec")
-            await asyncio.sleep(30)
+            delay = retry_backoff(attempt)
+            attempt += 1
+            _LOGGER.warning("Error on install observer plugin. Retry in %.1fsec", delay)
+            await asyncio.sleep(delay)
 
         _LOGGER.info("observer plugin now installed")
         self.version = self.instance.version
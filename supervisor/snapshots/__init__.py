@@ -2,6 +2,7 @@
 import asyncio
 import logging
 from pathlib import Path
+import shutil
 from typing import Set
 
 from ..const import FOLDER_OPENPEERPOWER, SNAPSHOT_FULL, SNAPSHOT_PARTIAL, CoreState
@@ -67,14 +68,18 @@ class SnapshotManager(CoreSysAttributes):
             if await snapshot.load():
                 self.snapshots_obj[snapshot.slug] = snapshot
 
-        tasks = [
-            _load_snapshot(tar_file)
-            for tar_file in self.sys_config.path_backup.glob("*.tar")
-        ]
+        tar_files = list(self.sys_config.path_backup.glob("*.tar"))
+        tasks = [_load_snapshot(tar_file) for tar_file in tar_files]
 
         _LOGGER.info("Found %d snapshot files", len(tasks))
-        if tasks:
-            await asyncio.wait(tasks)
+        if not tasks:
+            return
+
+        # Don't let a single broken snapshot file abort the reload
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for tar_file, result in zip(tar_files, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Can't load snapshot %s: %s", tar_file, result)
 
     def remove(self, snapshot):
         """Remove a snapshot."""
@@ -107,16 +112,14 @@ class SnapshotManager(CoreSysAttributes):
         # Move snapshot to backup
         tar_origin = Path(self.sys_config.path_backup, f"{snapshot.slug}.tar")
         try:
-            snapshot.tarfile.rename(tar_origin)
+            await self.sys_run_in_executor(shutil.move, snapshot.tarfile, tar_origin)
 
         except OSError as err:
             _LOGGER.error("Can't move snapshot file to storage: %s", err)
             return None
 
-        # Load new snapshot
-        snapshot = Snapshot(self.coresys, tar_origin)
-        if not await snapshot.load():
-            return None
+        # Metadata is unchanged by the move, only point to the new location
+        snapshot.tarfile = tar_origin
         _LOGGER.info("Successfully imported %s", snapshot.slug)
 
         self.snapshots_obj[snapshot.slug] = snapshot
@@ -180,8 +183,8 @@ class SnapshotManager(CoreSysAttributes):
                 # Snapshot add-ons
                 addon_list = []
                 for addon_slug in addons:
-                    addon = self.sys_addons.get(addon_slug)
-                    if addon and addon.is_installed:
+                    addon = self.sys_addons.get(addon_slug, local_only=True)
+                    if addon:
                         addon_list.append(addon)
                         continue
                     _LOGGER.warning("Add-on %s not found/installed", addon_slug)
@@ -264,8 +267,9 @@ class SnapshotManager(CoreSysAttributes):
 
                 # Delete delta add-ons
                 _LOGGER.info("Removing add-ons not in the snapshot %s", snapshot.slug)
+                snapshot_addons = set(snapshot.addon_list)
                 for addon in self.sys_addons.installed:
-                    if addon.slug in snapshot.addon_list:
+                    if addon.slug in snapshot_addons:
                         continue
 
                     # Remove Add-on because it's not a part of the new env
@@ -162,6 +162,11 @@ class Snapshot(CoreSysAttributes):
         """Return path to Snapshot tarfile."""
         return self._tarfile
 
+    @tarfile.setter
+    def tarfile(self, value: Path) -> None:
+        """Set path to Snapshot tarfile."""
+        self._tarfile = value
+
     def new(self, slug, name, date, sys_type, password=None):
         """Initialize a new snapshot."""
         # Init metadata
@@ -237,7 +242,7 @@ class Snapshot(CoreSysAttributes):
         # read snapshot.json
         try:
             raw = await self.sys_run_in_executor(_load_file)
-        except (tarfile.TarError, KeyError) as err:
+        except (tarfile.TarError, KeyError, OSError) as err:
             _LOGGER.error("Can't read snapshot tarfile %s: %s", self.tarfile, err)
             return False
 
@@ -28,6 +28,8 @@ from .resolution.const import ContextType, IssueType
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+CONNECTIVITY_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
 
 class Supervisor(CoreSysAttributes):
     """Open Peer Power core object for handle it."""
@@ -91,16 +93,22 @@ class Supervisor(CoreSysAttributes):
 
     async def update_apparmor(self) -> None:
         """Fetch last version and update profile."""
+        await self._load_apparmor(await self._fetch_apparmor())
+
+    async def _fetch_apparmor(self) -> str:
+        """Fetch last version of the AppArmor profile."""
         url = URL_OPPIO_APPARMOR
         try:
             _LOGGER.info("Fetching AppArmor profile %s", url)
             async with self.sys_websession.get(url, timeout=10) as request:
-                data = await request.text()
+                return await request.text()
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.warning("Can't fetch AppArmor profile: %s", err)
             raise SupervisorError() from err
 
+    async def _load_apparmor(self, data: str) -> None:
+        """Load AppArmor profile data into the host."""
         with TemporaryDirectory(dir=self.sys_config.path_tmp) as tmp_dir:
             profile_file = Path(tmp_dir, "apparmor.txt")
             try:
@@ -126,26 +134,36 @@ class Supervisor(CoreSysAttributes):
             return
 
         _LOGGER.info("Update Supervisor to version %s", version)
+
+        # Fetch the AppArmor profile while the new image is pulled
+        apparmor_task = self.sys_create_task(self._fetch_apparmor())
         try:
-            await self.instance.install(
-                version, image=self.sys_updater.image_supervisor
-            )
-            await self.instance.update_start_tag(
-                self.sys_updater.image_supervisor, version
-            )
-        except DockerError as err:
-            _LOGGER.error("Update of Supervisor failed!")
-            self.sys_resolution.create_issue(
-                IssueType.UPDATE_FAILED, ContextType.SUPERVISOR
-            )
-            self.sys_capture_exception(err)
-            raise SupervisorUpdateError() from err
-        else:
-            self.sys_config.version = version
-            self.sys_config.save_data()
+            try:
+                await self.instance.install(
+                    version, image=self.sys_updater.image_supervisor
+                )
+                await self.instance.update_start_tag(
+                    self.sys_updater.image_supervisor, version
+                )
+            except DockerError as err:
+                _LOGGER.error("Update of Supervisor failed!")
+                self.sys_resolution.create_issue(
+                    IssueType.UPDATE_FAILED, ContextType.SUPERVISOR
+                )
+                self.sys_capture_exception(err)
+                raise SupervisorUpdateError() from err
+            else:
+                self.sys_config.version = version
+                self.sys_config.save_data()
+
+            with suppress(SupervisorError):
+                await self._load_apparmor(await apparmor_task)
+        finally:
+            # Don't leave the fetch running or its error unretrieved
+            apparmor_task.cancel()
+            with suppress(SupervisorError, asyncio.CancelledError):
+                await apparmor_task
 
-        with suppress(SupervisorError):
-            await self.update_apparmor()
         self.sys_create_task(self.sys_core.stop())
 
     @Job(conditions=[JobCondition.RUNNING], on_condition=SupervisorJobError)
@@ -186,11 +204,12 @@ class Supervisor(CoreSysAttributes):
 
     async def check_connectivity(self):
         """Check the connection."""
-        timeout = aiohttp.ClientTimeout(total=10)
         try:
-            await self.sys_websession.head(
-                "https://version.openpeerpower.io/online.txt", timeout=timeout
-            )
+            async with self.sys_websession.head(
+                "https://version.openpeerpower.io/online.txt",
+                timeout=CONNECTIVITY_TIMEOUT,
+            ):
+                pass
         except (ClientError, asyncio.TimeoutError):
             self._connectivity = False
         else:
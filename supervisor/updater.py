@@ -4,9 +4,10 @@ from contextlib import suppress
 from datetime import timedelta
 import json
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 import aiohttp
+from aiohttp import hdrs
 from awesomeversion import AwesomeVersion
 
 from .const import (
@@ -42,6 +43,7 @@ class Updater(JsonConfig, CoreSysAttributes):
         """Initialize updater."""
         super().__init__(FILE_OPPIO_UPDATER, SCHEMA_UPDATER_CONFIG)
         self.coresys = coresys
+        self._etag: Optional[Tuple[Tuple[str, str, Optional[str]], str]] = None
 
     async def load(self) -> None:
         """Update internal data."""
@@ -178,10 +180,22 @@ class Updater(JsonConfig, CoreSysAttributes):
         url = URL_OPPIO_VERSION.format(channel=self.channel)
         machine = self.sys_machine or "default"
 
+        # Only reuse the ETag of the manifest currently held in our data
+        etag_key = (url, machine, self.sys_oppos.board)
+        headers = {}
+        if self._etag and self._etag[0] == etag_key:
+            headers[hdrs.IF_NONE_MATCH] = self._etag[1]
+
         try:
             _LOGGER.info("Fetching update data from %s", url)
-            async with self.sys_websession.get(url, timeout=10) as request:
-                data = await request.json(content_type=None)
+            async with self.sys_websession.get(
+                url, headers=headers, timeout=10
+            ) as request:
+                if request.status == 304:
+                    _LOGGER.debug("Update data from %s is unchanged", url)
+                    return
+                etag = request.headers.get(hdrs.ETAG)
+                data = json.loads(await request.read())
 
         except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.warning("Can't fetch versions from %s: %s", url, err)
@@ -196,6 +210,9 @@ class Updater(JsonConfig, CoreSysAttributes):
             _LOGGER.warning("Invalid data from %s", url)
             raise UpdaterError()
 
+        # Data no longer matches the stored ETag until fully processed
+        self._etag = None
+
         try:
             # Update supervisor version
             self._data[ATTR_SUPERVISOR] = AwesomeVersion(data["supervisor"])
@@ -234,3 +251,5 @@ class Updater(JsonConfig, CoreSysAttributes):
 
         else:
             self.save_data()
+            if etag:
+                self._etag = (etag_key, etag)
@@ -4,6 +4,7 @@ from datetime import datetime
 from ipaddress import IPv4Address
 import logging
 from pathlib import Path
+import random
 import re
 import socket
 from typing import Any, Optional
@@ -12,12 +13,22 @@ _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 RE_STRING: re.Pattern = re.compile(r"\x1b(\[.*?[@-~]|\].*?(\x07|\x1b\\))")
 
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_CAP = 60.0
+
 
 def convert_to_ascii(raw: bytes) -> str:
     """Convert binary to ascii and remove colors."""
     return RE_STRING.sub("", raw.decode())
 
 
+def retry_backoff(attempt: int) -> float:
+    """Return a full jitter exponential backoff delay for a retry attempt."""
+    return random.uniform(
+        0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** min(attempt, 16))
+    )
+
+
 def process_lock(method):
     """Wrap function with only run once."""
 
@@ -70,15 +70,15 @@ DBUS_METHOD_GETALL: str = "org.freedesktop.DBus.Properties.GetAll"
 
 def _convert_bytes(value: str) -> str:
     """Convert bytes to string or byte-array."""
-    data: bytes = bytes(int(char, 0) for char in value.split(", "))
-    return f"[{', '.join(str(char) for char in data)}]"
+    data: bytes = bytes.fromhex(value.replace("0x", "").replace(", ", ""))
+    return str(list(data))
 
 
 def _convert_bytes_string(value: str) -> str:
     """Convert bytes to string or byte-array."""
     data = RE_BIN_STRING_OCT.sub(lambda x: chr(int(x.group(1), 8)), value)
     data = RE_BIN_STRING_HEX.sub(lambda x: chr(int(f"0x{x.group(1)}", 0)), data)
-    return f"[{', '.join(str(char) for char in list(char for char in data.encode()))}]"
+    return str(list(data.encode()))
 
 
 class DBus:
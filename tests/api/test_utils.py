@@ -0,0 +1,60 @@
+"""Test API utils."""
+from unittest.mock import AsyncMock, MagicMock
+
+from aiohttp import WSMsgType
+
+from supervisor.api.utils import websocket_forward
+
+
+class MockWebSocket:
+    """Mock a websocket with incoming messages."""
+
+    def __init__(self, messages):
+        """Initialize websocket."""
+        self._messages = messages
+
+    def __aiter__(self):
+        """Iterate over messages."""
+        return self
+
+    async def __anext__(self):
+        """Return next message."""
+        if not self._messages:
+            raise StopAsyncIteration()
+        return self._messages.pop(0)
+
+
+async def test_websocket_forward():
+    """Test forwarding all websocket message types."""
+    ws_from = MockWebSocket(
+        [
+            MagicMock(type=WSMsgType.TEXT, data="text"),
+            MagicMock(type=WSMsgType.BINARY, data=b"binary"),
+            MagicMock(type=WSMsgType.PING),
+            MagicMock(type=WSMsgType.PONG),
+        ]
+    )
+    ws_to = AsyncMock()
+
+    await websocket_forward(ws_from, ws_to)
+
+    ws_to.send_str.assert_called_once_with("text")
+    ws_to.send_bytes.assert_called_once_with(b"binary")
+    ws_to.ping.assert_called_once()
+    ws_to.pong.assert_called_once()
+
+
+async def test_websocket_forward_closed_target():
+    """Test forwarding stops quietly when the target is gone."""
+    ws_from = MockWebSocket(
+        [
+            MagicMock(type=WSMsgType.TEXT, data="first"),
+            MagicMock(type=WSMsgType.TEXT, data="second"),
+        ]
+    )
+    ws_to = AsyncMock()
+    ws_to.send_str.side_effect = ConnectionResetError()
+
+    await websocket_forward(ws_from, ws_to)
+
+    ws_to.send_str.assert_called_once_with("first")
@@ -0,0 +1,38 @@
+"""Test docker running containers lookup."""
+from unittest.mock import MagicMock
+
+import docker
+import pytest
+import requests
+
+from supervisor.coresys import CoreSys
+from supervisor.exceptions import DockerAPIError, DockerRequestError
+
+
+def test_running_containers(coresys: CoreSys):
+    """Test running container names are returned without leading slash."""
+    coresys.docker.api = MagicMock()
+    coresys.docker.api.containers.return_value = [
+        {"Names": ["/addon_local_ssh"]},
+        {"Names": ["/addon_core_mosquitto", "/mqtt"]},
+    ]
+
+    assert coresys.docker.running_containers() == {
+        "addon_local_ssh",
+        "addon_core_mosquitto",
+        "mqtt",
+    }
+    coresys.docker.api.containers.assert_called_once_with(filters={"status": "running"})
+
+
+def test_running_containers_errors(coresys: CoreSys):
+    """Test Docker errors are mapped on running containers lookup."""
+    coresys.docker.api = MagicMock()
+
+    coresys.docker.api.containers.side_effect = docker.errors.APIError("fail")
+    with pytest.raises(DockerAPIError):
+        coresys.docker.running_containers()
+
+    coresys.docker.api.containers.side_effect = requests.ConnectionError()
+    with pytest.raises(DockerRequestError):
+        coresys.docker.running_containers()
@@ -0,0 +1,55 @@
+"""Test periodic add-on tasks."""
+# pylint: disable=protected-access
+from unittest.mock import AsyncMock, MagicMock
+
+from supervisor.const import AddonState
+from supervisor.coresys import CoreSys
+
+
+def _mock_addon(slug: str, watchdog: bool) -> MagicMock:
+    """Return a started add-on mock."""
+    addon = MagicMock(
+        slug=slug,
+        watchdog=watchdog,
+        state=AddonState.STARTED,
+        in_progress=False,
+        start=AsyncMock(),
+    )
+    addon.instance.name = f"addon_{slug}"
+    return addon
+
+
+def _mock_running(coresys: CoreSys, *names: str) -> None:
+    """Mock running containers on Docker."""
+    coresys.docker.api = MagicMock()
+    coresys.docker.api.containers.return_value = [
+        {"Names": [f"/{name}"]} for name in names
+    ]
+
+
+async def test_watchdog_addon_docker(coresys: CoreSys):
+    """Test watchdog restarts only add-ons with a missing container."""
+    running = _mock_addon("running", watchdog=True)
+    missing = _mock_addon("missing", watchdog=True)
+    coresys.addons.local = {"running": running, "missing": missing}
+    _mock_running(coresys, "addon_running", "openpeerpower")
+
+    await coresys.tasks._watchdog_addon_docker()
+
+    coresys.docker.api.containers.assert_called_once()
+    running.start.assert_not_called()
+    missing.start.assert_called_once()
+
+
+async def test_refresh_addon(coresys: CoreSys):
+    """Test refresh marks only add-ons with a missing container stopped."""
+    running = _mock_addon("running", watchdog=False)
+    missing = _mock_addon("missing", watchdog=False)
+    coresys.addons.local = {"running": running, "missing": missing}
+    _mock_running(coresys, "addon_running", "openpeerpower")
+
+    await coresys.tasks._refresh_addon()
+
+    coresys.docker.api.containers.assert_called_once()
+    assert running.state == AddonState.STARTED
+    assert missing.state == AddonState.STOPPED
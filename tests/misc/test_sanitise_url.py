@@ -7,3 +7,7 @@ def test_sanitize_url():
     assert sanitize_url("test") == "test"
     assert sanitize_url("http://my.duckdns.org") == "http://example.com"
     assert sanitize_url("http://my.duckdns.org/test") == "http://example.com/test"
+    assert (
+        sanitize_url("http://a.com/x\nhttp://b.org/y")
+        == "http://example.com/x\nhttp://example.com/y"
+    )
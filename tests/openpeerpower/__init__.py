@@ -0,0 +1 @@
+"""Open Peer Power tests."""
@@ -0,0 +1,22 @@
+"""Test Open Peer Power core."""
+from unittest.mock import patch
+
+import docker
+import pytest
+
+from supervisor.coresys import CoreSys
+from supervisor.exceptions import OpenPeerPowerError
+
+
+async def test_start_docker_error_on_initialize(coresys: CoreSys):
+    """Test Docker errors while checking the container raise core error."""
+    with patch(
+        "supervisor.docker.interface.DockerInterface._is_running",
+        return_value=False,
+    ), patch.object(
+        coresys.docker.containers,
+        "get",
+        side_effect=docker.errors.APIError("daemon failure"),
+    ):
+        with pytest.raises(OpenPeerPowerError):
+            await coresys.openpeerpower.core.start()
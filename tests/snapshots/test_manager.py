@@ -0,0 +1,41 @@
+"""Test snapshot manager."""
+import io
+import json
+from pathlib import Path
+import tarfile
+from unittest.mock import PropertyMock, patch
+
+from supervisor.const import SNAPSHOT_FULL
+from supervisor.coresys import CoreSys
+
+
+def _create_tar(tar_file: Path, snapshot_json: bytes) -> None:
+    """Create a snapshot tarfile with the given snapshot.json content."""
+    with tarfile.open(tar_file, "w:") as snapshot:
+        info = tarfile.TarInfo("./snapshot.json")
+        info.size = len(snapshot_json)
+        snapshot.addfile(info, io.BytesIO(snapshot_json))
+
+
+async def test_reload_skips_corrupt_snapshot(coresys: CoreSys, tmp_path):
+    """Test a corrupt snapshot doesn't prevent loading the others."""
+    _create_tar(
+        Path(tmp_path, "valid.tar"),
+        json.dumps(
+            {
+                "slug": "valid",
+                "type": SNAPSHOT_FULL,
+                "name": "Valid",
+                "date": "2021-01-01T00:00:00.000000+00:00",
+            }
+        ).encode(),
+    )
+    _create_tar(Path(tmp_path, "corrupt.tar"), b"\xff\xfe\xfa")
+
+    with patch(
+        "supervisor.config.CoreConfig.path_backup",
+        new=PropertyMock(return_value=tmp_path),
+    ):
+        await coresys.snapshots.reload()
+
+    assert set(coresys.snapshots.snapshots_obj) == {"valid"}
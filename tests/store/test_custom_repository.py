@@ -13,8 +13,8 @@ async def test_add_valid_repository(coresys, store_manager):
     """Test add custom repository."""
     current = coresys.config.addons_repositories
     with patch("supervisor.store.repository.Repository.load", return_value=None), patch(
-        "pathlib.Path.read_text",
-        return_value=json.dumps({"name": "Awesome repository"}),
+        "pathlib.Path.read_bytes",
+        return_value=json.dumps({"name": "Awesome repository"}).encode(),
     ), patch("pathlib.Path.exists", return_value=True):
         await store_manager.update_repositories(current + ["http://example.com"])
         assert store_manager.get_from_url("http://example.com").validate()
@@ -26,10 +26,10 @@ async def test_add_valid_repository_url(coresys, store_manager):
     """Test add custom repository."""
     current = coresys.config.addons_repositories
     with patch("supervisor.store.repository.Repository.load", return_value=None), patch(
-        "pathlib.Path.read_text",
+        "pathlib.Path.read_bytes",
         return_value=json.dumps(
             {"name": "Awesome repository", "url": "http://example2.com/docs"}
-        ),
+        ).encode(),
     ), patch("pathlib.Path.exists", return_value=True):
         await store_manager.update_repositories(current + ["http://example.com"])
         assert store_manager.get_from_url("http://example.com").validate()
@@ -41,8 +41,8 @@ async def test_add_invalid_repository(coresys, store_manager):
     """Test add custom repository."""
     current = coresys.config.addons_repositories
     with patch("supervisor.store.repository.Repository.load", return_value=None), patch(
-        "pathlib.Path.read_text",
-        return_value="",
+        "pathlib.Path.read_bytes",
+        return_value=b"",
     ):
         await store_manager.update_repositories(current + ["http://example.com"])
         assert not store_manager.get_from_url("http://example.com").validate()
@@ -56,8 +56,8 @@ async def test_add_invalid_repository_file(coresys, store_manager):
     """Test add custom repository."""
     current = coresys.config.addons_repositories
     with patch("supervisor.store.repository.Repository.load", return_value=None), patch(
-        "pathlib.Path.read_text",
-        return_value=json.dumps({"name": "Awesome repository"}),
+        "pathlib.Path.read_bytes",
+        return_value=json.dumps({"name": "Awesome repository"}).encode(),
     ), patch("pathlib.Path.exists", return_value=False):
         await store_manager.update_repositories(current + ["http://example.com"])
         assert not store_manager.get_from_url("http://example.com").validate()
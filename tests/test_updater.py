@@ -0,0 +1,94 @@
+"""Test updater version data fetch."""
+# pylint: disable=protected-access
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from aiohttp import hdrs
+from awesomeversion import AwesomeVersion
+import json
+
+from supervisor.const import UpdateChannel
+from supervisor.coresys import CoreSys
+
+
+def _version_data(channel: UpdateChannel, version: str) -> bytes:
+    """Return version data for a channel."""
+    image = f"openpeerpower/{channel}-{{arch}}"
+    return json.dumps(
+        {
+            "channel": channel,
+            "supervisor": version,
+            "openpeerpower": {"qemux86-64": version},
+            "cli": version,
+            "dns": version,
+            "audio": version,
+            "observer": version,
+            "multicast": version,
+            "image": {
+                "core": image,
+                "supervisor": image,
+                "audio": image,
+                "cli": image,
+                "dns": image,
+                "observer": image,
+                "multicast": image,
+            },
+        }
+    ).encode()
+
+
+class MockResponse:
+    """Mock a version data response."""
+
+    def __init__(self, status: int, body: bytes = b"", etag: str = None):
+        """Initialize response."""
+        self.status = status
+        self.headers = {hdrs.ETAG: etag} if etag else {}
+        self._body = body
+
+    async def read(self) -> bytes:
+        """Return body."""
+        return self._body
+
+    async def __aenter__(self):
+        """Enter request context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Exit request context."""
+
+
+async def test_fetch_data_etag_channel_switch(coresys: CoreSys):
+    """Test switching channel A -> B -> A doesn't keep data of channel B."""
+    coresys.supervisor._connectivity = True
+    coresys._machine = "qemux86-64"
+    coresys._websession = MagicMock()
+    coresys.websession.get.side_effect = [
+        MockResponse(200, _version_data(UpdateChannel.STABLE, "1.0.0"), "stable"),
+        MockResponse(200, _version_data(UpdateChannel.BETA, "2.0.0b0"), "beta"),
+        MockResponse(200, _version_data(UpdateChannel.STABLE, "1.0.0"), "stable"),
+        MockResponse(304),
+    ]
+
+    # Avoid the fetch throttle between the calls
+    now = datetime.now()
+    with patch("supervisor.utils.datetime") as mock_datetime:
+        mock_datetime.now.side_effect = [now + timedelta(hours=i) for i in range(1, 5)]
+
+        coresys.updater.channel = UpdateChannel.STABLE
+        await coresys.updater.fetch_data()
+        assert coresys.updater.version_supervisor == AwesomeVersion("1.0.0")
+
+        coresys.updater.channel = UpdateChannel.BETA
+        await coresys.updater.fetch_data()
+        assert coresys.updater.version_supervisor == AwesomeVersion("2.0.0b0")
+
+        coresys.updater.channel = UpdateChannel.STABLE
+        await coresys.updater.fetch_data()
+        assert coresys.updater.version_supervisor == AwesomeVersion("1.0.0")
+
+        await coresys.updater.fetch_data()
+        assert coresys.updater.version_supervisor == AwesomeVersion("1.0.0")
+
+    headers = [call.kwargs["headers"] for call in coresys.websession.get.mock_calls]
+    assert headers == [{}, {}, {}, {hdrs.IF_NONE_MATCH: "stable"}]
@@ -1,5 +1,7 @@
 """test json."""
-from supervisor.utils.json import write_json_file
+from awesomeversion import AwesomeVersion
+
+from supervisor.utils.json import read_json_file, write_json_file
 
 
 def test_file_permissions(tmp_path):
@@ -18,3 +20,15 @@ def test_new_file_permissions(tmp_path):
 
     write_json_file(tempfile, {"test": "data"})
     assert oct(tempfile.stat().st_mode)[-3:] == "600"
+
+
+def test_write_read_json_file(tmp_path):
+    """Test write and read back a json file with Supervisor objects."""
+    tempfile = tmp_path / "test.json"
+    write_json_file(tempfile, {"version": AwesomeVersion("2021.1.0"), "list": {"a"}})
+
+    assert (
+        tempfile.read_text()
+        == '{\n  "version": "2021.1.0",\n  "list": [\n    "a"\n  ]\n}'
+    )
+    assert read_json_file(tempfile) == {"version": "2021.1.0", "list": ["a"]}
@@ -0,0 +1,15 @@
+"""Test retry backoff helper."""
+from supervisor.utils import RETRY_BACKOFF_CAP, retry_backoff
+
+
+def test_retry_backoff_grows():
+    """Test delay window grows with attempts."""
+    for attempt in range(4):
+        for _ in range(20):
+            assert 0 <= retry_backoff(attempt) <= 2 ** attempt
+
+
+def test_retry_backoff_capped():
+    """Test delay never exceeds the cap."""
+    for attempt in (6, 10, 100, 10000):
+        assert 0 <= retry_backoff(attempt) <= RETRY_BACKOFF_CAP